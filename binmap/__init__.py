@@ -1,8 +1,20 @@
 import dataclasses
+import operator
 import struct
 from enum import IntEnum, IntFlag
-from functools import partial
-from typing import Callable, ClassVar, Dict, List, Tuple, Type, Union, get_type_hints
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_type_hints,
+)
 
 from binmap import types as b_types
 
@@ -19,27 +31,26 @@ class BaseDescriptor:
         self.name = name
 
 
+def _unchecked(value):
+    """Validator accepting any value, bounds are then only checked when packed"""
+
+
 class BinField(BaseDescriptor):
-    """BinField descriptor tries to pack it into a struct before setting the
-    value as a bounds checker"""
+    """BinField descriptor checks the value against the bounds of the field
+    before setting it. It has no __get__, so reads are served straight from
+    the instance __dict__.
 
-    def __get__(self, obj, owner):
-        return obj.__dict__[self.name]
+    :param name: Variable name
+    :param validator: Function raising struct.error for values out of bounds,
+      the bound pack method of a precompiled Struct for the field. Defaults to
+      accepting any value"""
+
+    def __init__(self, name="", validator=_unchecked):
+        self.name = name
+        self.validator = validator
 
     def __set__(self, obj, value):
-        type_hints = get_type_hints(obj)
-        if self.name in type_hints:
-            struct.pack(datatypemapping[type_hints[self.name]][1], value)
-        else:
-            found = False
-            for base in type(obj).__bases__:
-                type_hints = get_type_hints(base)
-                if self.name in type_hints:
-                    struct.pack(datatypemapping[type_hints[self.name]][1], value)
-                    found = True
-
-            if not found:
-                raise ValueError(self.name)
+        self.validator(value)
         obj.__dict__[self.name] = value
 
 
@@ -59,14 +70,20 @@ class PaddingField(BaseDescriptor):
 class EnumField(BinField):
     """EnumField descriptor uses "enum" to map to and from strings. Accepts
     both strings and values when setting. Only values that has a corresponding
-    string is allowed."""
+    string is allowed.
+
+    :param name: Variable name
+    :param enumclass: IntEnum or IntFlag the values are checked against"""
+
+    def __init__(self, name="", enumclass=None):
+        self.name = name
+        self.enumclass = enumclass
 
     def __set__(self, obj, value):
-        datafieldsmap = {f.name: f for f in dataclasses.fields(obj)}
         if isinstance(value, str):
-            datafieldsmap[self.name].metadata["enum"][value]
+            value = self.enumclass[value]
         else:
-            datafieldsmap[self.name].metadata["enum"](value)
+            self.enumclass(value)
         obj.__dict__[self.name] = value
 
 
@@ -125,6 +142,33 @@ datatypemapping: Dict[type, Tuple[Type[BaseDescriptor], str]] = {
 }
 
 
+@lru_cache(maxsize=None)
+def _compilestruct(fmt: str) -> struct.Struct:
+    """
+    Compiles a format, sharing the Struct between classes and fields with the
+    same layout
+
+    :param str fmt: struct format string including byteorder
+    :return: compiled Struct
+    """
+    return struct.Struct(fmt)
+
+
+def _fieldgetter(names: Tuple[str, ...]) -> Callable:
+    """
+    Creates a function that returns the named attributes as a tuple
+
+    :param names: Attribute names to fetch
+    :return: function returning a tuple of attribute values
+    """
+    if len(names) == 1:
+        getter = operator.attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    if names:
+        return operator.attrgetter(*names)
+    return lambda obj: ()
+
+
 def padding(length: int = 1) -> dataclasses.Field:
     """
     Field generator function for padding elements
@@ -155,17 +199,21 @@ def autolength(offset: int = 0) -> dataclasses.Field:
     return dataclasses.field(default=offset, init=False, metadata={"autolength": True})  # type: ignore
 
 
-def stringfield(length: int = 1, default: bytes = b"") -> dataclasses.Field:
+def stringfield(
+    length: int = 1, default: bytes = b"", fillchar: bytes = b"\x00"
+) -> dataclasses.Field:
     """
     Field generator function for string fields.
 
     :param int lenght: lengt of the string.
     :param bytes default: default value of the string
-    :param bytes fillchar: char to pad the string with
+    :param bytes fillchar: char to fill the default with when none is given
     :return: dataclass field
     """
+    if len(fillchar) != 1:
+        raise ValueError("fillchar must be exactly one byte")
     if default == b"":
-        default = b"\x00" * length
+        default = fillchar * length
     return dataclasses.field(default=default, metadata={"length": length})  # type: ignore
 
 
@@ -199,47 +247,108 @@ class BinmapDataclass:
     """
 
     __binarydata: dataclasses.InitVar[bytes] = b""
-    __datafields: ClassVar[List[str]]
-    __datafieldsmap: ClassVar[Dict]
-    __formatstring: ClassVar[str]
-
-    def __init_subclass__(cls, byteorder: str = ">"):
+    __datafields: ClassVar[Tuple[str, ...]]
+    __getter: ClassVar[Callable] = staticmethod(_fieldgetter(()))
+    __initvalues: ClassVar[Dict[str, Any]] = {}
+    __constants: ClassVar[Tuple[Tuple[int, Any, str], ...]]
+    __assignments: ClassVar[Tuple[Tuple[int, str], ...]]
+    __enums: ClassVar[Tuple[Tuple[int, str], ...]]
+    __calculated: ClassVar[Tuple[Tuple[int, Callable], ...]]
+    __struct: ClassVar[struct.Struct]
+    __validate: ClassVar[bool] = True
+
+    def __init_subclass__(cls, byteorder: str = ">", validate: Optional[bool] = None):
         """
         Subclass initiator. This makes the inheriting class a dataclass.
         :param str byteorder: byteorder for binary data
+        :param bool validate: check bounds when plain fields are set, otherwise
+          they are plain attributes and checked when packed. Inherited from the
+          parent class when not given
         """
-        dataclasses.dataclass(cls)
+        if validate is None:
+            validate = cls.__validate
+        cls.__validate = validate
+        dataclasses.dataclass(cls, eq=False)
         type_hints = get_type_hints(cls)
 
-        cls.__formatstring = byteorder
-        cls.__datafieldsmap = {}
-        cls.__datafields = []
-
+        metadata = {}
+        formats = [byteorder]
+        datafields = []
+        initvalues = {}
+        autolengths: Dict[str, int] = {}
         lastfield = ""
+        lastname: Tuple[str, ...] = ()
         for field_ in dataclasses.fields(cls):
             if field_.name.startswith("_BinmapDataclass__"):
                 continue
+            # Without a __get__ dataclasses picks up an inherited descriptor
+            # as the default of a field redeclared without one
+            if isinstance(field_.default, BaseDescriptor):
+                raise TypeError(f"Field {field_.name} must have a default value")
+            metadata[field_.name] = field_.metadata
             _base, _type = datatypemapping[type_hints[field_.name]]
+            if type_hints[field_.name] is b_types.pad:
+                _type = field_.default * _type  # type: ignore
+            if type_hints[field_.name] in (b_types.string, b_types.pascalstring, str):
+                _type = str(field_.metadata["length"]) + _type
             if "constant" in field_.metadata:
+                # Fail when the class is defined rather than on first pack
+                _compilestruct(byteorder + _type).pack(field_.default)
                 _base = ConstField
+                initvalues[field_.name] = field_.default
             elif "enum" in field_.metadata:
-                _base = EnumField
+                _base = partial(EnumField, enumclass=field_.metadata["enum"])  # type: ignore
             elif "autolength" in field_.metadata:
                 _base = ConstField
+                autolengths[field_.name] = field_.default  # type: ignore
             elif "function" in field_.metadata:
                 _base = partial(CalculatedField, function=field_.metadata["function"])  # type: ignore
-            setattr(cls, field_.name, _base(name=field_.name))
-            if type_hints[field_.name] is b_types.pad:
-                _type = field_.default * _type  # type: ignore
-            if type_hints[field_.name] in (b_types.string, b_types.pascalstring, str):
-                _type = str(field_.metadata["length"]) + _type
+                initvalues[field_.name] = field_.metadata["function"]
+            elif _base is BinField and validate:
+                _base = partial(BinField, validator=_compilestruct(byteorder + _type).pack)  # type: ignore
+            if _base is BinField:
+                # Shadows any descriptor inherited from a validating base
+                setattr(cls, field_.name, field_.default)
+            else:
+                setattr(cls, field_.name, _base(name=field_.name))
             if "last" in field_.metadata and field_.metadata["last"]:
                 if lastfield != "":
                     raise ValueError("Can't have more than one last")
                 lastfield = _type
+                lastname = (field_.name,)
             else:
-                cls.__formatstring += _type
-        cls.__formatstring += lastfield
+                formats.append(_type)
+                if _base is not PaddingField:
+                    datafields.append(field_.name)
+        formats.append(lastfield)
+        cls.__datafields = tuple(datafields) + lastname
+        cls.__getter = staticmethod(_fieldgetter(cls.__datafields))
+        cls.__struct = _compilestruct("".join(formats))
+        for name, offset in autolengths.items():
+            initvalues[name] = cls.__struct.size + offset
+        cls.__initvalues = initvalues
+
+        constants = []
+        assignments = []
+        enums = []
+        calculated = []
+        for index, name in enumerate(cls.__datafields):
+            if "constant" in metadata[name]:
+                constants.append(
+                    (index, initvalues[name], "Constant doesn't match binary data")
+                )
+            elif "autolength" in metadata[name]:
+                constants.append((index, initvalues[name], "Length doesn't match"))
+            elif "function" in metadata[name]:
+                calculated.append((index, metadata[name]["function"]))
+            elif "enum" in metadata[name]:
+                enums.append((index, name))
+            else:
+                assignments.append((index, name))
+        cls.__constants = tuple(constants)
+        cls.__assignments = tuple(assignments)
+        cls.__enums = tuple(enums)
+        cls.__calculated = tuple(calculated)
 
     def __bytes__(self):
         """
@@ -247,53 +356,31 @@ class BinmapDataclass:
         :return: Binary string packed.
         :rtype: bytes
         """
-        values = []
-        lastvalue = None
-        for k, v in self.__dict__.items():
-            if k.startswith("_BinmapDataclass__"):
-                continue
-            if callable(v):
-                v = v(self)
-            if (
-                "last" in self.__datafieldsmap[k].metadata
-                and self.__datafieldsmap[k].metadata["last"]
-            ):
-                lastvalue = v
-                continue
-            values.append(v)
-        if lastvalue is not None:
-            values.append(lastvalue)
+        return self.__struct.pack(*self.__getter(self))
 
-        return struct.pack(
-            self.__formatstring,
-            *values,
-        )
+    def pack_into(self, buffer, offset: int = 0):
+        """
+        Packs the class' fields into a writable buffer
+        :param buffer: Writable buffer, for example a bytearray
+        :param int offset: Position in buffer to start writing at
+        """
+        self.__struct.pack_into(buffer, offset, *self.__getter(self))
+
+    def __eq__(self, other):
+        """
+        Compares field values with another instance of the same class
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.__getter(self) == self.__getter(other)
 
     def __post_init__(self, _binarydata: bytes):
         """
         Initialises fields from a binary string
         :param bytes _binarydata: Binary string that will be unpacked.
         """
-        # Kludgy hack to keep order
-        for f in dataclasses.fields(self):
-            if f.name.startswith("_BinmapDataclass__"):
-                continue
-            self.__datafieldsmap.update({f.name: f})
-            if "padding" in f.metadata:
-                continue
-            if "constant" in f.metadata:
-                self.__dict__.update({f.name: f.default})
-            if "autolength" in f.metadata:
-                self.__dict__.update(
-                    {f.name: struct.calcsize(self.__formatstring) + f.default}  # type: ignore
-                )
-            if "function" in f.metadata:
-                self.__dict__.update({f.name: f.metadata["function"]})
-            else:
-                val = getattr(self, f.name)
-                del self.__dict__[f.name]
-                self.__dict__.update({f.name: val})
-            self.__datafields.append(f.name)
+        # Fields that aren't set by the generated __init__
+        self.__dict__.update(self.__initvalues)
         if _binarydata != b"":
             self.frombytes(_binarydata)
 
@@ -302,16 +389,58 @@ class BinmapDataclass:
         Unpacks value to each field
         :param bytes value: binary string to unpack
         """
-        args = struct.unpack(self.__formatstring, value)
-        for arg, name in zip(args, self.__datafields):
-            if "constant" in self.__datafieldsmap[name].metadata:
-                if arg != self.__datafieldsmap[name].default:
-                    raise ValueError("Constant doesn't match binary data")
-            elif "autolength" in self.__datafieldsmap[name].metadata:
-                if arg != getattr(self, name):
-                    raise ValueError("Length doesn't match")
-            elif "function" in self.__datafieldsmap[name].metadata:
-                if arg != self.__datafieldsmap[name].metadata["function"](self):
-                    raise ValueError("Wrong calculated value")
-            else:
-                setattr(self, name, arg)
+        self.__fromtuple(self.__struct.unpack(value))
+
+    @classmethod
+    def iterfrombytes(cls, value: bytes) -> Iterator["BinmapDataclass"]:
+        """
+        Unpacks consecutive records from a binary string
+        :param bytes value: binary string holding a whole number of records
+        :return: Iterator with one instance per record
+        """
+        for args in cls.__struct.iter_unpack(value):
+            yield cls.__fromargs(args)
+
+    @classmethod
+    def frombuffer(cls, buffer, offset: int = 0) -> "BinmapDataclass":
+        """
+        Unpacks one record from a buffer without copying it out first
+        :param buffer: buffer at least offset plus the record size long
+        :param int offset: Position in buffer where the record starts
+        :return: New instance
+        """
+        return cls.__fromargs(cls.__struct.unpack_from(buffer, offset))
+
+    @classmethod
+    def __fromargs(cls, args: Tuple) -> "BinmapDataclass":
+        """
+        Creates an instance from unpacked values
+        :param tuple args: values in struct order
+        :return: New instance
+        """
+        if cls.__post_init__ is not BinmapDataclass.__post_init__:
+            # A subclass hook has to run exactly as it does for cls(data)
+            return cls(cls.__struct.pack(*args))
+        # Every field is set from args or __initvalues, so skip __init__
+        obj = cls.__new__(cls)
+        obj.__dict__.update(cls.__initvalues)
+        obj.__fromtuple(args)
+        return obj
+
+    def __fromtuple(self, args: Tuple):
+        """
+        Checks and sets fields from unpacked values
+        :param tuple args: values in struct order
+        """
+        for index, expected, message in self.__constants:
+            if args[index] != expected:
+                raise ValueError(message)
+        # Unpacked values are always in bounds, only enums need checking
+        values = self.__dict__
+        for index, name in self.__assignments:
+            values[name] = args[index]
+        for index, name in self.__enums:
+            setattr(self, name, args[index])
+        for index, function in self.__calculated:
+            if args[index] != function(self):
+                raise ValueError("Wrong calculated value")
@@ -20,6 +20,15 @@ def test_baseclass_with_keyword():
     assert "got an unexpected keyword argument 'temp'" in str(excinfo)
 
 
+def test_binfield_without_validator():
+    class Plain:
+        value = binmap.BinField("value")
+
+    p = Plain()
+    p.value = 300
+    assert p.value == 300
+
+
 class Temp(binmap.BinmapDataclass):
     temp: b_types.unsignedchar = 0
 
@@ -29,6 +38,12 @@ class TempHum(binmap.BinmapDataclass):
     humidity: b_types.unsignedchar = 0
 
 
+class TempHumPostInit(TempHum):
+    def __post_init__(self, _binarydata: bytes):
+        super().__post_init__(_binarydata)
+        self.dewpoint = self.temp - (100 - self.humidity) // 5
+
+
 def test_different_classes_eq():
     t = Temp(temp=10)
     th = TempHum(temp=10, humidity=60)
@@ -64,6 +79,21 @@ def test_dataformats():
     assert bytes(be) == bytes(le)
 
 
+class StandardLong(binmap.BinmapDataclass):
+    value: b_types.long = 0
+
+
+def test_standard_size_bounds():
+    sl = StandardLong(value=2**31 - 1)
+    assert bytes(sl) == b"\x7f\xff\xff\xff"
+    with pytest.raises(struct.error):
+        sl.value = 2**31
+    with pytest.raises(struct.error):
+        StandardLong(value=-(2**31) - 1)
+    with pytest.raises(struct.error):
+        sl.value = "10"
+
+
 class TestTempClass:
     def test_with_argument(self):
         t = Temp(temp=10)
@@ -128,6 +158,52 @@ class TestTempClass:
         assert t1 != t2
 
 
+class UncheckedTempHum(binmap.BinmapDataclass, validate=False):
+    temp: b_types.unsignedchar = 0
+    humidity: b_types.unsignedchar = 0
+
+
+class TestUncheckedClass:
+    def test_plain_attributes(self):
+        th = UncheckedTempHum(temp=10, humidity=60)
+        th.temp = 256
+        assert th.temp == 256
+        with pytest.raises(struct.error) as excinfo:
+            bytes(th)
+        assert "format requires 0 <= number <= 255" in str(excinfo)
+
+        th.temp = 20
+        assert bytes(th) == b"\x14\x3c"
+        assert UncheckedTempHum(b"\x14\x3c") == th
+
+    def test_unchecked_inheritance(self):
+        class Child(TempHum, validate=False):
+            pass
+
+        ch = Child()
+        ch.temp = -1
+        assert ch.temp == -1
+        with pytest.raises(struct.error):
+            bytes(ch)
+
+    def test_unchecked_parent(self):
+        class Child(UncheckedTempHum):
+            pass
+
+        ch = Child()
+        ch.temp = 256
+        assert ch.temp == 256
+        with pytest.raises(struct.error):
+            bytes(ch)
+
+        class CheckedChild(UncheckedTempHum, validate=True):
+            pass
+
+        cc = CheckedChild()
+        with pytest.raises(struct.error):
+            cc.temp = 256
+
+
 class TestTempHumClass:
     def test_with_argument(self):
         th = TempHum(temp=10, humidity=60)
@@ -156,6 +232,41 @@ class TestTempHumClass:
         assert th.humidity == 30
         assert bytes(th) == b"\x1e\x1e"
 
+    def test_iterfrombytes(self):
+        ths = list(TempHum.iterfrombytes(b"\x0a\x46\x14\x3c"))
+        assert ths == [TempHum(temp=10, humidity=70), TempHum(temp=20, humidity=60)]
+        assert list(TempHum.iterfrombytes(b"")) == []
+
+        with pytest.raises(struct.error):
+            list(TempHum.iterfrombytes(b"\x0a\x46\x14"))
+
+    def test_post_init_override(self):
+        data = b"\x14\x3c"
+        th = TempHumPostInit(data)
+        assert th.dewpoint == 12
+        assert TempHumPostInit.frombuffer(data).dewpoint == 12
+        assert [t.dewpoint for t in TempHumPostInit.iterfrombytes(data * 2)] == [12, 12]
+
+    def test_frombuffer(self):
+        buffer = bytearray(b"\x00\x0a\x46\x14")
+        assert TempHum.frombuffer(buffer) == TempHum(temp=0, humidity=10)
+        assert TempHum.frombuffer(buffer, 1) == TempHum(temp=10, humidity=70)
+        assert TempHum.frombuffer(memoryview(buffer), 2) == TempHum(
+            temp=70, humidity=20
+        )
+
+        with pytest.raises(struct.error):
+            TempHum.frombuffer(buffer, 3)
+
+    def test_pack_into(self):
+        th = TempHum(temp=10, humidity=70)
+        buffer = bytearray(4)
+        th.pack_into(buffer, 2)
+        assert buffer == b"\x00\x00\x0a\x46"
+
+        with pytest.raises(struct.error):
+            th.pack_into(buffer, 3)
+
     def test_compare_equal(self):
         th1 = TempHum(temp=10, humidity=70)
         th2 = TempHum(temp=10, humidity=70)
@@ -183,6 +294,14 @@ class StringWithDefault(binmap.BinmapDataclass):
     defaultstring: b_types.string = binmap.stringfield(10, default=b"hellohello")
 
 
+class StringWithFill(binmap.BinmapDataclass):
+    filledstring: b_types.string = binmap.stringfield(10, fillchar=b" ")
+
+
+class PascalStringWithDefault(binmap.BinmapDataclass):
+    pascalstring: b_types.pascalstring = binmap.stringfield(10, default=b"hi")
+
+
 class TestStrings:
     def test_strings(self):
         s = Strings()
@@ -201,6 +320,22 @@ class TestStrings:
         sd1 = StringWithDefault(defaultstring=b"worldworld")
         assert sd1.defaultstring == b"worldworld"
 
+    def test_fillchar(self):
+        sf = StringWithFill()
+        assert sf.filledstring == b"          "
+        assert bytes(sf) == b"          "
+        assert StringWithFill(bytes(sf)) == sf
+
+        with pytest.raises(ValueError) as excinfo:
+            binmap.stringfield(3, fillchar=b"ab")
+        assert "fillchar must be exactly one byte" in str(excinfo)
+
+    def test_pascalstring_default(self):
+        ps = PascalStringWithDefault()
+        assert ps.pascalstring == b"hi"
+        assert bytes(ps) == b"\x02hi\x00\x00\x00\x00\x00\x00\x00"
+        assert PascalStringWithDefault(bytes(ps)) == ps
+
 
 class Pad(binmap.BinmapDataclass):
     temp: b_types.unsignedchar = 0
@@ -244,6 +379,10 @@ class TestPadClass:
         p.humidity = 60
         assert bytes(p) == b"\x0a\x00\x00\x3c"
 
+    def test_compare(self):
+        assert Pad(temp=10, humidity=60) == Pad(b"\x0a\x10\x20\x3c")
+        assert Pad(temp=10, humidity=60) != Pad(temp=10, humidity=61)
+
     def test_advanced_pad(self):
         p = AdvancedPad(temp=10, humidity=60)
         with pytest.raises(AttributeError) as excinfo:
@@ -316,12 +455,20 @@ class TestEnumClass:
         assert ec.wind == WindEnum.South
         assert str(ec) == "EnumClass(temp=10, wind=2)"
 
+        with pytest.raises(ValueError) as excinfo:
+            EnumClass(b"\x0a\x07")
+        assert "7 is not a valid WindEnum" in str(excinfo)
+
     def test_set_named_enum(self):
         ec = EnumClass()
         ec.wind = WindEnum.South
         assert ec.wind == 2
         assert bytes(ec) == b"\x00\x02"
 
+        ec.wind = "West"
+        assert ec.wind == WindEnum.West
+        assert bytes(ec) == b"\x00\x03"
+
         with pytest.raises(KeyError) as excinfo:
             ec.wind = "Norhtwest"
         assert "'Norhtwest'" in str(excinfo)
@@ -392,6 +539,25 @@ class TestConstValues:
         assert c.datatype == 0x15
         assert c.status == 1
 
+        cs = list(ConstValues.iterfrombytes(b"\x15\x01\x15\x02"))
+        assert [c.status for c in cs] == [1, 2]
+        with pytest.raises(ValueError) as excinfo:
+            list(ConstValues.iterfrombytes(b"\x15\x01\x14\x02"))
+        assert "Constant doesn't match binary data" in str(excinfo)
+
+        with pytest.raises(ValueError) as excinfo:
+            c.frombytes(b"\x14\x05")
+        assert "Constant doesn't match binary data" in str(excinfo)
+        assert c.status == 1
+
+    def test_constant_out_of_range(self):
+        with pytest.raises(struct.error) as excinfo:
+
+            class BadConst(binmap.BinmapDataclass):
+                datatype: b_types.unsignedchar = binmap.constant(0x100)
+
+        assert "format requires 0 <= number <= 255" in str(excinfo)
+
 
 class AllDatatypes(binmap.BinmapDataclass):
     _pad: b_types.pad = binmap.padding(1)
@@ -508,6 +674,24 @@ class TestInheritance:
         assert asdict(ch) == {"temp": 10, "humidity": 40}
         assert astuple(ch) == (10, 40)
 
+    def test_inheritance_compare(self):
+        class Child(Temp):
+            pass
+
+        assert Child(temp=10) == Child(temp=10)
+        assert Child(temp=10) != Temp(temp=10)
+        assert Temp(temp=10) != Child(temp=10)
+        with pytest.raises(TypeError):
+            hash(Child(temp=10))
+
+    def test_inheritance_without_default(self):
+        with pytest.raises(TypeError) as excinfo:
+
+            class Child(TempHum):
+                temp: b_types.unsignedchar
+
+        assert "Field temp must have a default value" in str(excinfo)
+
     def test_simple_inheritance_binary(self):
         class Child(Temp):
             humidity: b_types.unsignedchar = 0
@@ -599,6 +783,15 @@ class TestAutolength:
         assert al.length == 2
         assert al.temp == 10
 
+    def test_autolength_iterfrombytes(self):
+        als = list(AutoLength.iterfrombytes(b"\x02\x0a\x02\x0b"))
+        assert als == [AutoLength(temp=10), AutoLength(temp=11)]
+        assert [bytes(al) for al in als] == [b"\x02\x0a", b"\x02\x0b"]
+
+        with pytest.raises(ValueError) as excinfo:
+            list(AutoLength.iterfrombytes(b"\x02\x0a\x01\x0b"))
+        assert "Length doesn't match" in str(excinfo)
+
     def test_autolength_inheritance(self):
         class Child(AutoLength):
             humidity: b_types.unsignedchar = 0
@@ -670,6 +863,11 @@ class TestCalculatedField:
             CalculatedField(b"\xe4\x18\x00")
         assert "Wrong calculated value" in str(excinfo)
 
+    def test_calculated_field_iterfrombytes(self):
+        cfs = list(CalculatedField.iterfrombytes(b"\xe2\x12\xf4\xe5\x0a\xef"))
+        assert [cf.checksum for cf in cfs] == [244, 239]
+        assert str(cfs[1]) == "CalculatedField(temp=-27, hum=10, checksum=239)"
+
     def test_calculated_field_set(self):
         cf = CalculatedField()
         with pytest.raises(AttributeError) as excinfo:
@@ -685,6 +883,16 @@ class TestCalculatedField:
         assert cfl.checksum == 30
         assert bytes(cfl) == b"\x0a\x14\x1e"
 
+    def test_calculated_field_last_binary(self):
+        cfl = CalculatedFieldLast(b"\x0a\x14\x1e")
+        assert cfl.temp == 10
+        assert cfl.hum == 20
+        assert cfl.checksum == 30
+
+        with pytest.raises(ValueError) as excinfo:
+            CalculatedFieldLast(b"\x0a\x14\x1f")
+        assert "Wrong calculated value" in str(excinfo)
+
     def test_calculated_field_last_inherit(self):
         class CalculatedFieldLastInherit(CalculatedFieldLast):
             lux: b_types.unsignedinteger = 0